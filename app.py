@@ -1,7 +1,19 @@
 import streamlit as st
+import atexit
+import json
+import os
 import pickle
+import numpy as np
 import pandas as pd
 import requests
+import threading
+from html import escape
+from pathlib import Path
+from string import Template
+from urllib.parse import quote_plus
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 
 # ================== CONFIG & UI THEME ==================
 # Using your OMDB Key
@@ -13,123 +25,36 @@ except KeyError:
 
 st.set_page_config(page_title="NextWatch", layout="wide")
 
-st.markdown("""
-<style>
-    /* Global Styles */
-    .main { 
-        background-color: #0d1117; 
-        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-    }
-    
-    /* Clean Grid Spacing */
-    .stColumn {
-        padding-left: 0.5rem !important;
-        padding-right: 0.5rem !important;
-    }
-    
-    /* Movie Card - Poster Only */
-    .movie-card {
-        background-color: transparent;
-        border: none;
-        box-shadow: none;
-        overflow: visible;
-        height: auto;
-        display: flex;
-        flex-direction: column;
-        margin-bottom: 2rem;
-        cursor: pointer;
-        transition: transform 0.3s ease;
-    }
-    
-    /* Hover Effect - Scale Image Only */
-    .movie-card:hover {
-        transform: translateY(-5px);
-    }
-    
-    /* Poster Image */
-    .movie-img {
-        width: 100%;
-        height: 240px;
-        border-radius: 12px;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.2);
-        object-fit: cover;
-        object-position: top center;
-        opacity: 0.95;
-        transition: opacity 0.3s ease, transform 0.3s ease, box-shadow 0.3s ease;
-        display: block;
-    }
-    
-    .movie-card:hover .movie-img {
-        opacity: 1;
-        box-shadow: 0 12px 24px rgba(0, 0, 0, 0.5);
-    }
-    
-    /* Title Section - Below Poster */
-    .movie-title {
-        height: auto;
-        min-height: 40px;
-        padding: 10px 5px 0 5px;
-        text-align: center;
-        width: 100%;
-        
-        /* Typography */
-        color: #e6edf3;
-        font-size: 14px;
-        font-weight: 500;
-        letter-spacing: 0.02em;
-        line-height: 1.4;
-        
-        /* Background Removed */
-        background: transparent;
-        border: none;
-        
-        /* Truncation */
-        display: -webkit-box;
-        -webkit-line-clamp: 2;
-        -webkit-box-orient: vertical;
-        overflow: hidden;
-    }
+PLACEHOLDER_POSTER = "https://via.placeholder.com/300x450?text=No+Image"
+
+
+@st.cache_resource  # Read the stylesheet once; the markup itself is still sent every rerun
+def load_css():
+    return f"<style>{Path('static/style.css').read_text()}</style>"
 
-    /* Remove Link Decoration */
-    a { text-decoration: none !important; color: inherit !important; }
-
-    /* Button Styling */
-    .stButton > button {
-        background-color: #238636;
-        color: white;
-        border: none;
-        border-radius: 6px;
-        font-weight: 600;
-        padding: 0.5rem 1rem;
-        transition: background-color 0.2s;
-    }
-    
-    .stButton > button:hover {
-        background-color: #2ea043;
-    }
-    
-    .detail-container { 
-        background: #161b22; 
-        padding: 2rem; 
-        border-radius: 12px; 
-        border: 1px solid #30363d;
-        margin-bottom: 2rem; 
-    }
-</style>
-""", unsafe_allow_html=True)
+
+st.markdown(load_css(), unsafe_allow_html=True)
 
 
 # ================== DATA LOADING (OPTIMIZED) ==================
 @st.cache_resource  # This prevents the app from reloading data on every click
 def load_assets():
     # UPDATED PATHS for Pro Structure
-    movies = pickle.load(open("data/moviess.pkl", "rb"))
-    
+    # Parquet (from prepare_data.py) lets us read only the columns the app uses
+    if os.path.exists("data/movies.parquet"):
+        movies = pd.read_parquet("data/movies.parquet", columns=["title", "vote_average"])
+    else:
+        movies = pickle.load(open("data/moviess.pkl", "rb"))
+
+    # Prefer the top-K neighbours from prepare_data.py: ~2 MB instead of the full N x N matrix
+    if os.path.exists("data/similarity_topk.npz"):
+        with np.load("data/similarity_topk.npz") as topk:
+            similarity = {"neighbors": topk["neighbors"], "scores": topk["scores"]}
+    # Next best: the float16 matrix, memory-mapped so only touched rows are read
+    elif os.path.exists("data/similarity.npy"):
+        similarity = np.load("data/similarity.npy", mmap_mode="r")
     # Handle split similarity file for GitHub compatibility
-    import os
-    import numpy as np
-    
-    if os.path.exists("data/similarities.pkl"):
+    elif os.path.exists("data/similarities.pkl"):
         similarity = pickle.load(open("data/similarities.pkl", "rb"))
     elif os.path.exists("data/similarities_part1.pkl"):
         # Load parts and combine
@@ -141,80 +66,265 @@ def load_assets():
         else:
              similarity = np.concatenate((part1, part2), axis=0)
     else:
-        st.error("Similarity data not found (checked .pkl and split parts).")
+        st.error("Similarity data not found (checked .npz, .npy, .pkl and split parts).")
         st.stop()
-        
-    return movies, similarity
+
+    # O(1) title lookups; reversed so duplicate titles keep their first row, like .index[0] did
+    title_to_idx = {title: i for i, title in reversed(list(enumerate(movies["title"].values)))}
+    # Selectbox options, materialized once instead of Series -> ndarray -> list per rerun
+    titles_tuple = tuple(movies["title"].values)
+    # Plain arrays for the hot path: numpy fancy indexing instead of a Series per row
+    titles_arr = movies["title"].to_numpy()
+    if 'vote_average' in movies.columns:
+        ratings_arr = movies['vote_average'].fillna(0).to_numpy()
+    else:
+        ratings_arr = np.zeros(len(movies))
+
+    # Trending order (best rated first) is sorted once here rather than on every rerun
+    trending_order = np.argsort(-ratings_arr, kind="stable")
+
+    # Only the derived lookups are kept; the DataFrame itself isn't used past this point
+    return {
+        "similarity": similarity,
+        "title_to_idx": title_to_idx,
+        "titles_tuple": titles_tuple,
+        "titles_arr": titles_arr,
+        "ratings_arr": ratings_arr,
+        "trending_order": trending_order,
+    }
 
 
 try:
-    movies, similarity = load_assets()
+    assets = load_assets()
 except FileNotFoundError:
     st.error("Data files not found in 'data/' directory. Please check file structure.")
     st.stop()
 
+similarity = assets["similarity"]
+title_to_idx = assets["title_to_idx"]
+titles_tuple = assets["titles_tuple"]
+titles_arr = assets["titles_arr"]
+ratings_arr = assets["ratings_arr"]
+trending_order = assets["trending_order"]
+
+N_MOVIES = len(titles_arr)
+
 
 # ================== API & LOGIC ==================
-def fetch_movie_details(title):
+@st.cache_resource  # One keep-alive session shared by every rerun and worker thread
+def get_http_session():
+    session = requests.Session()
+    # Retry brief server hiccups only; Retry-After is ignored so a 429 can't stall a worker for long.
+    # read=0: a stalled read isn't retried, so a hanging OMDB costs one timeout, not three
+    retry = Retry(total=2, connect=1, read=0, backoff_factor=0.2,
+                  status_forcelist=[429, 500, 502, 503, 504], allowed_methods=frozenset({"GET"}),
+                  respect_retry_after_header=False, raise_on_status=False)
+    # Pool sized for the two fetch thread pools, so connections (and TLS handshakes) get reused
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_resource  # OMDB misses, remembered across restarts
+def load_unknown_titles():
+    not_found, no_poster = set(), set()
+    try:
+        # Plain JSON rather than pickle: a writable data file shouldn't be able to run code on load
+        with open("data/omdb_misses.json") as f:
+            saved = json.load(f)
+        not_found, no_poster = set(saved["not_found"]), set(saved["no_poster"])
+    except (OSError, ValueError, TypeError, KeyError):
+        pass  # Missing or damaged: it's only a cache, start empty
+    # "not_found": OMDB has no such movie. "no_poster": it does, but its Poster is "N/A"
+    store = {"not_found": not_found, "no_poster": no_poster, "lock": threading.Lock(), "unsaved": 0}
+    # Flush whatever the batching below held back. The handler looks the store up at exit: a
+    # rebuilt resource registers again, and a stale store must not overwrite the current file
+    atexit.register(flush_unknown_titles)
+    return store
+
+
+def flush_unknown_titles():
+    save_unknown_titles(load_unknown_titles())
+
+
+def save_unknown_titles(store):
+    with store["lock"]:
+        if not store["unsaved"]:
+            return
+        # Write a temp file and swap it in, so a kill mid-write can't leave truncated JSON
+        tmp_path = f"data/omdb_misses.json.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump({"not_found": sorted(store["not_found"]), "no_poster": sorted(store["no_poster"])}, f)
+            os.replace(tmp_path, "data/omdb_misses.json")
+        except OSError:
+            # Read-only deploy: still skipped for this process. Retry after the next full batch,
+            # not on every miss
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        store["unsaved"] = 0
+
+
+def remember_unknown_title(title, kind="not_found"):
+    store = load_unknown_titles()
+    with store["lock"]:
+        if title in store[kind]:
+            return
+        store[kind].add(title)
+        store["unsaved"] += 1
+        due = store["unsaved"] >= 20  # Rewrite the file in batches, not once per miss
+    if due:
+        save_unknown_titles(store)
+
+
+@st.cache_data(ttl=60 * 60 * 24, max_entries=5000, show_spinner=False)  # Saves the 1000/day OMDB quota
+def request_movie_details(title, _session):
+    # Anything but a definite answer raises, so st.cache_data doesn't keep a failure for a day
+    params = {"t": title, "apikey": API_KEY}
+    response = _session.get("https://www.omdbapi.com/", params=params, timeout=(1, 2))  # (connect, read) seconds
+    response.raise_for_status()
+    data = response.json()
+    if data.get("Response") == "True":
+        if data.get("Poster") in [None, "N/A", ""]:
+            remember_unknown_title(title, "no_poster")  # Grids skip it; the detail panel still asks
+        return data
+    if data.get("Error") == "Movie not found!":
+        remember_unknown_title(title)
+        return None
+    # Quota/key errors ("Request limit reached!", "Invalid API key!") can recover: don't cache
+    raise requests.RequestException(data.get("Error", "Unexpected OMDB response"))
+
+
+def fetch_movie_details(title, session):
     """Fetches full movie metadata and poster from OMDB"""
-    url = f"https://www.omdbapi.com/?t={title}&apikey={API_KEY}"
+    if title in load_unknown_titles()["not_found"]:
+        return None
     try:
-        data = requests.get(url).json()
-        if data.get("Response") == "True":
-            return data
-    except:
-        pass
-    return None
+        return request_movie_details(title, session)
+    except (requests.RequestException, ValueError):
+        return None
+
+
+@st.cache_resource  # Long-lived workers, so each keeps its pooled keep-alive connection warm
+def get_fetch_executor(name="omdb"):
+    # Background prefetches get their own pool, so a page's fetches never queue behind them
+    return ThreadPoolExecutor(max_workers=10, thread_name_prefix=name)
+
+
+def fetch_many_posters(titles, executor_name="omdb"):
+    """Fetches the poster URL for several titles concurrently, preserving order"""
+    session = get_http_session()
+    store = load_unknown_titles()  # Warm the cached resource here, not from inside the worker threads
+    # Duplicate titles share one request; titles known to have no poster need none
+    unique_titles = [t for t in dict.fromkeys(titles) if t not in store["no_poster"]]
+    # Network-bound: overlap the round-trips instead of paying them one by one
+    results = get_fetch_executor(executor_name).map(lambda t: fetch_movie_details(t, session), unique_titles)
+    posters = {title: details.get("Poster") for title, details in zip(unique_titles, results) if details}
+    return [posters[title] if posters.get(title) not in [None, "N/A", ""] else PLACEHOLDER_POSTER
+            for title in titles]
+
+
+def prefetch_posters(titles):
+    """Warms the OMDB cache for titles in a background thread, without blocking the page"""
+    # Build the shared resources on the script thread; the worker then only gets cache hits
+    get_http_session()
+    load_unknown_titles()
+    get_fetch_executor("omdb-prefetch")
+    thread = threading.Thread(target=fetch_many_posters, args=(titles, "omdb-prefetch"), daemon=True)
+    thread.start()
+    return thread
+
+
+@st.cache_resource  # Runs once per server process, shared by every session
+def preload_trending_details(count=20):
+    """Warms the OMDB cache for the top trending titles before the first grid asks for them"""
+    # A grid fetch of a title already in flight waits on st.cache_data's per-key lock, not a second call
+    return prefetch_posters(titles_arr[trending_order[:count]].tolist())
+
+
+def similarity_row(index):
+    """Returns the candidate movie indices and their similarity scores for one movie"""
+    if isinstance(similarity, dict):  # Top-K neighbours, already in rank order
+        return similarity["neighbors"][index], similarity["scores"][index]
+    distances = np.asarray(similarity[index])
+    return np.arange(len(distances)), distances
+
+
+@st.cache_data(ttl=3600, max_entries=512, show_spinner=False)  # Revisiting a movie is instant
+def recommend_titles(movie_name, num_movies):
+    """Ranks the recommended titles; posters are looked up separately so failures aren't memoized"""
+    index = title_to_idx[movie_name]
+    neighbors, distances = similarity_row(index)
+
+    # ADVANCED LOGIC: Get 30 similar movies first, then sort by rating
+    # Partial selection (O(N)) instead of sorting every movie; only the 31 best get sorted.
+    # Everything tied with the cutoff is kept so ties still resolve by row order.
+    k = min(31, len(distances))
+    cutoff = np.partition(distances, len(distances) - k)[len(distances) - k]
+    candidates = np.flatnonzero(distances >= cutoff)
+    movie_list = neighbors[candidates[np.argsort(-distances[candidates], kind="stable")][1:k]]
+
+    # Sort the similar movies by their ratings (Hybrid approach)
+    top_picks = movie_list[np.argsort(-ratings_arr[movie_list], kind="stable")[:num_movies]]
+    return titles_arr[top_picks].tolist()
 
 
 def recommend(movie_name, num_movies):
-    index = movies[movies["title"] == movie_name].index[0]
-    distances = similarity[index]
+    names = recommend_titles(movie_name, num_movies)
 
-    # ADVANCED LOGIC: Get 30 similar movies first, then sort by rating
-    movie_list = sorted(list(enumerate(distances)), reverse=True, key=lambda x: x[1])[1:31]
+    # Already cached per title; a failed lookup is retried on the next rerun
+    posters = fetch_many_posters(names)
 
-    recommendations = []
-    for i in movie_list:
-        m_data = movies.iloc[i[0]]
-        recommendations.append({
-            'title': m_data.title,
-            'rating': m_data.get('vote_average', 0)
-        })
+    return names, posters
 
-    # Sort the similar movies by their ratings (Hybrid approach)
-    top_picks = sorted(recommendations, key=lambda x: x['rating'], reverse=True)[:num_movies]
-
-    names = []
-    posters = []
-    for m in top_picks:
-        details = fetch_movie_details(m['title'])
-        names.append(m['title'])
-        poster = details.get("Poster") if details else None
-        if poster in [None, "N/A", ""]:
-            poster = "https://via.placeholder.com/300x450?text=No+Image"
-        posters.append(poster)
 
-    return names, posters
+# ================== UI HELPERS ==================
+# Parsed once at import; each card is a plain substitution
+CARD_TEMPLATE = Template(
+    '<a href="?movie=$query" target="_self" style="text-decoration: none; color: inherit;">'
+    '<div class="movie-card">'
+    '<img class="movie-img" src="$poster" alt="$title" loading="lazy" decoding="async" '
+    f'onerror="this.onerror=null;this.src=\'{PLACEHOLDER_POSTER}\';">'
+    '<div class="movie-title">$title</div>'
+    '</div>'
+    '</a>'
+)
+
+
+def card_html(title, poster_url):
+    """Returns the markup for one clickable movie card"""
+    if poster_url in [None, "N/A", ""]:
+        poster_url = PLACEHOLDER_POSTER
+    return CARD_TEMPLATE.substitute(query=quote_plus(title), poster=escape(poster_url), title=escape(title))
 
 
-import urllib.parse
+def render_movie_grid(titles, posters):
+    """Renders every card with a single st.markdown call instead of one per column"""
+    cards = "".join(card_html(title, poster) for title, poster in zip(titles, posters))
+    st.markdown(f'<div class="movie-grid">{cards}</div>', unsafe_allow_html=True)
+
 
 # ================== APP STRUCTURE ==================
+# Session defaults, initialized in one place
+SESSION_DEFAULTS = {
+    "trending_offset": 0,
+    "selected_movie_name": None,
+}
+for key, value in SESSION_DEFAULTS.items():
+    st.session_state.setdefault(key, value)
+
 # Handle URL parameters for direct linking
 if "movie" in st.query_params:
     url_movie = st.query_params["movie"]
     # Ensure it's a valid movie
-    if url_movie in movies["title"].values:
-        if 'selected_movie_name' not in st.session_state or st.session_state.selected_movie_name != url_movie:
-            st.session_state.selected_movie_name = url_movie
-            st.session_state.movie_selectbox = url_movie
+    if url_movie in title_to_idx and st.session_state.selected_movie_name != url_movie:
+        st.session_state.selected_movie_name = url_movie
+        st.session_state.movie_selectbox = url_movie
 
-if 'trending_offset' not in st.session_state:
-    st.session_state.trending_offset = 0
-
-if 'selected_movie_name' not in st.session_state:
-    st.session_state.selected_movie_name = None
+# Start on the first page view, so the first trending grid (and the first Refresh) finds them in flight
+preload_trending_details()
 
 def set_movie(movie_title):
     st.session_state.selected_movie_name = movie_title
@@ -222,33 +332,53 @@ def set_movie(movie_title):
 
 def go_back():
     st.session_state.selected_movie_name = None
+    st.session_state.movie_selectbox = None
     st.query_params.clear()
 
+def next_trending_page():
+    st.session_state.trending_offset += 10
+
+@st.fragment  # "Refresh" reruns just this section, not the sidebar and search bar
+def show_trending():
+    # Align header and button vertically
+    col_t1, col_t2 = st.columns([5, 1], gap="small")
+    with col_t1:
+        st.markdown("<h3 style='margin-top: 5px; margin-bottom: 20px;'>Trending Now</h3>", unsafe_allow_html=True)
+    with col_t2:
+        st.markdown("<div style='margin-top: 5px;'></div>", unsafe_allow_html=True)
+        st.button("Refresh", use_container_width=True, on_click=next_trending_page)
+
+    # Get top movies with offset: a slice of the precomputed rating order
+    start_idx = st.session_state.trending_offset % (N_MOVIES - 10) # Loop around
+    trending_titles = titles_arr[trending_order[start_idx : start_idx + 10]].tolist()
+    trending_posters = fetch_many_posters(trending_titles)
+
+    # Grid display for trending
+    render_movie_grid(trending_titles, trending_posters)
+
+    # Warm the page "Refresh" shows next while the user looks at this one
+    next_idx = (st.session_state.trending_offset + 10) % (N_MOVIES - 10)
+    prefetch_posters(titles_arr[trending_order[next_idx : next_idx + 10]].tolist())
+
 st.title("NextWatch")
 st.markdown("---")
 
 # Sidebar Controls
 st.sidebar.header("Settings")
 if st.session_state.selected_movie_name:
-    if st.sidebar.button("Back to Trending", use_container_width=True):
-        go_back()
-        st.rerun()
+    # Callback runs before the next rerun, so no second st.rerun() is needed
+    st.sidebar.button("Back to Trending", use_container_width=True, on_click=go_back)
         
 num_rec = st.sidebar.number_input("Number of Recommendations", min_value=1, max_value=30, value=5)
 
 # Centered Search Bar
 col_spacer1, col_search, col_spacer2 = st.columns([1, 2, 1])
 with col_search:
-    # Safely get index
-    try:
-        val = st.session_state.get("selected_movie_name")
-        default_index = list(movies["title"].values).index(val) if val in movies["title"].values else None
-    except:
-        default_index = None
+    default_index = title_to_idx.get(st.session_state.selected_movie_name)
 
     selected_movie = st.selectbox(
         "Type to search for a movie:",
-        movies["title"].values,
+        titles_tuple,
         index=default_index,
         placeholder="Start typing a movie name...",
         key="movie_selectbox" 
@@ -269,7 +399,7 @@ else:
 if selected_movie:
     # 1. Show Details of the Searched Movie
     with st.status("Fetching data...", expanded=False):
-        current_info = fetch_movie_details(selected_movie)
+        current_info = fetch_movie_details(selected_movie, get_http_session())
 
     if current_info:
         with st.container():
@@ -278,7 +408,7 @@ if selected_movie:
             with col_a:
                 poster = current_info.get("Poster")
                 if poster in [None, "N/A", ""]:
-                    poster = "https://via.placeholder.com/300x450?text=No+Image"
+                    poster = PLACEHOLDER_POSTER
                 st.image(poster, use_container_width=True)
             with col_b:
                 st.subheader(f"{selected_movie} ({current_info.get('Year')})")
@@ -298,75 +428,12 @@ if selected_movie:
     # 2. Get and Show Recommendations
     names, posters = recommend(selected_movie, num_rec)
     
-    # Grid display for recommendations (Row-based for alignment)
-    for i in range(0, len(names), 5):
-        row_cols = st.columns(5, gap="medium")
-        for j, col in enumerate(row_cols):
-            if i + j < len(names):
-                with col:
-                    poster_url = posters[i+j]
-                    if poster_url in [None, "N/A", ""]:
-                        poster_url = "https://via.placeholder.com/300x450?text=No+Image"
-                        
-                    title = names[i+j]
-                    link = f"?movie={urllib.parse.quote(title)}"
-                    st.markdown(f"""
-                        <a href="{link}" target="_self" style="text-decoration: none; color: inherit;">
-                            <div class="movie-card">
-                                <img class="movie-img" src="{poster_url}" alt="{title}" onerror="this.onerror=null;this.src='https://via.placeholder.com/300x450?text=No+Image';">
-                                <div class="movie-title">{title}</div>
-                            </div>
-                        </a>
-                    """, unsafe_allow_html=True)
+    # Whole grid in one markdown call; the CSS grid handles the 5-per-row layout
+    render_movie_grid(names, posters)
 
 else:
     # Default: Show Trending Movies
-    # Align header and button vertically
-    col_t1, col_t2 = st.columns([5, 1], gap="small")
-    with col_t1:
-        st.markdown("<h3 style='margin-top: 5px; margin-bottom: 20px;'>Trending Now</h3>", unsafe_allow_html=True)
-    with col_t2:
-        st.markdown("<div style='margin-top: 5px;'></div>", unsafe_allow_html=True)
-        if st.button("Refresh", use_container_width=True):
-            st.session_state.trending_offset += 10
-            st.rerun()
-    
-    # Get top movies with offset
-    if 'vote_average' in movies.columns:
-        # Sort by rating and take a slice based on offset
-        sorted_movies = movies.sort_values(by='vote_average', ascending=False)
-        start_idx = st.session_state.trending_offset % (len(sorted_movies) - 10) # Loop around
-        trending_movies = sorted_movies.iloc[start_idx : start_idx + 10]
-    else:
-        # Just take a slice
-        start_idx = st.session_state.trending_offset % (len(movies) - 10)
-        trending_movies = movies.iloc[start_idx : start_idx + 10]
-        
-    trending_titles = trending_movies['title'].tolist()
-    
-    # Grid display for trending (Row-based for alignment)
-    for i in range(0, len(trending_titles), 5):
-        row_cols = st.columns(5, gap="medium")
-        for j, col in enumerate(row_cols):
-            if i + j < len(trending_titles):
-                with col:
-                    title = trending_titles[i+j]
-                    details = fetch_movie_details(title)
-                    poster_url = details.get("Poster") if details else "https://via.placeholder.com/300x450"
-                    
-                    # Handle N/A posters explicitly
-                    if poster_url in [None, "N/A", ""]:
-                        poster_url = "https://via.placeholder.com/300x450?text=No+Image"
-                    
-                    link = f"?movie={urllib.parse.quote(title)}"
-                    st.markdown(f"""
-                        <a href="{link}" target="_self" style="text-decoration: none; color: inherit;">
-                            <div class="movie-card">
-                                <img class="movie-img" src="{poster_url}" alt="{title}" onerror="this.onerror=null;this.src='https://via.placeholder.com/300x450?text=No+Image';">
-                                <div class="movie-title">{title}</div>
-                            </div>
-                        </a>
-                    """, unsafe_allow_html=True)
+    show_trending()
 
 # Footer
 st.markdown("<br><br><div style='text-align: center; color: #8b949e; font-size: 0.8rem;'>Designed for Professional Portfolio | 2026</div>", 
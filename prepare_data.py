@@ -0,0 +1,68 @@
+"""Converts the pickled assets in data/ into the compact formats app.py prefers.
+
+Run once after regenerating the pickles:  python prepare_data.py
+Add --dense to also write the full float16 matrix (data/similarity.npy, ~46 MB), which app.py
+only falls back to when data/similarity_topk.npz is missing.
+"""
+import os
+import pickle
+import sys
+
+import numpy as np
+
+
+# ================== SOURCE DATA ==================
+def load_movies():
+    """Loads the pickled movie metadata DataFrame"""
+    with open("data/moviess.pkl", "rb") as f:
+        return pickle.load(f)
+
+
+def load_similarity():
+    """Loads the full similarity matrix from the pickle (or its split parts)"""
+    if os.path.exists("data/similarities.pkl"):
+        with open("data/similarities.pkl", "rb") as f:
+            return np.asarray(pickle.load(f))
+
+    with open("data/similarities_part1.pkl", "rb") as f:
+        part1 = pickle.load(f)
+    with open("data/similarities_part2.pkl", "rb") as f:
+        part2 = pickle.load(f)
+    return np.concatenate((np.asarray(part1), np.asarray(part2)), axis=0)
+
+
+# ================== CONVERSIONS ==================
+TOP_K = 100  # recommend() only ranks the 30 nearest, so 100 leaves plenty of headroom
+
+
+APP_COLUMNS = ["title", "vote_average"]  # The only movie columns app.py reads
+
+
+def write_movies_parquet(movies):
+    # Just the columns the app reads; overviews, tags and the rest stay in the pickle
+    movies[APP_COLUMNS].to_parquet("data/movies.parquet", compression="zstd", index=False)
+
+
+def write_similarity_npy(similarity):
+    # float16 halves the bytes per row read, and .npy can be memory-mapped by app.py
+    np.save("data/similarity.npy", similarity.astype(np.float16))
+
+
+def write_similarity_topk(similarity, k=TOP_K):
+    # Keep only each row's k nearest movies (a fixed-width CSR): O(N*K) instead of O(N^2).
+    # Stable sort so equal scores stay in row order, exactly as ranking the full row would.
+    neighbors = np.argsort(-similarity, axis=1, kind="stable")[:, :k].astype(np.int32)
+    scores = np.take_along_axis(similarity, neighbors, axis=1).astype(np.float32)
+    np.savez_compressed("data/similarity_topk.npz", neighbors=neighbors, scores=scores)
+
+
+if __name__ == "__main__":
+    write_movies_parquet(load_movies())
+    print("Wrote data/movies.parquet")
+
+    similarity = load_similarity()
+    write_similarity_topk(similarity)
+    print(f"Wrote data/similarity_topk.npz {similarity.shape}")
+    if "--dense" in sys.argv[1:]:
+        write_similarity_npy(similarity)
+        print("Wrote data/similarity.npy")